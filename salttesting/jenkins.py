@@ -14,13 +14,18 @@
 from __future__ import absolute_import, print_function
 import os
 import sys
+import errno
+import atexit
+import glob
 import json
+import shutil
 import time
 import pipes
 import random
 import hashlib
 import socket
 import argparse
+import tempfile
 
 # Import salt libs
 import salt.config
@@ -121,6 +126,17 @@ def print_bulleted(options, message, color='LIGHT_BLUE'):
     print_flush(' {0}*{ENDC} {1}'.format(colors[color], message, **colors))
 
 
+def ensure_dir(path):
+    '''
+    Create ``path``, and any missing parents, unless it already exists
+    '''
+    try:
+        os.makedirs(path)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+
+
 def save_state(options):
     '''
     Save some state data to be used between executions, minion IP address, minion states synced, etc...
@@ -1543,8 +1559,6 @@ def build_ssh_opts(options):
         '-oStrictHostKeyChecking=no',
         # Set hosts key database path to /dev/null, ie, non-existing
         '-oUserKnownHostsFile=/dev/null',
-        # Don't re-use the SSH connection. Less failures.
-        '-oControlPath=none',
         # tell SSH to skip password authentication
         '-oPasswordAuthentication=no',
         '-oChallengeResponseAuthentication=no',
@@ -1557,9 +1571,56 @@ def build_ssh_opts(options):
             os.path.join(options.workspace, 'jenkins_test_account_key')
         )
     ]
+    if getattr(options, 'ssh_control_master', False):
+        ssh_args.extend([
+            # Share a single SSH connection among all SSH calls
+            '-oControlMaster=auto',
+            '-oControlPath={0}%r@%h:%p'.format(get_ssh_control_path()),
+            '-oControlPersist=300s'
+        ])
+    else:
+        # Don't re-use the SSH connection. Less failures.
+        ssh_args.append('-oControlPath=none')
     return ssh_args
 
 
+# Private directory holding this process' SSH control master sockets
+_SSH_CONTROL_DIR = None
+
+
+def get_ssh_control_path():
+    '''
+    Return the path prefix of the SSH control master sockets of this process.
+
+    The sockets are kept in a directory only we can write to, otherwise any
+    other user on the build host could plant a socket where ssh would connect
+    to it.
+    '''
+    global _SSH_CONTROL_DIR
+    if _SSH_CONTROL_DIR is None:
+        _SSH_CONTROL_DIR = tempfile.mkdtemp(prefix='jenkins-ssh-')
+    return os.path.join(_SSH_CONTROL_DIR, '')
+
+
+def stop_ssh_control_master(options):
+    '''
+    Shutdown the SSH control master connections, if any were started, and
+    remove their sockets directory
+    '''
+    if _SSH_CONTROL_DIR is None:
+        # No SSH connection was made
+        return
+    control_path = get_ssh_control_path()
+    for socket_path in glob.glob('{0}*'.format(control_path)):
+        # The socket name is ``<user>@<host>:<port>``
+        target = socket_path[len(control_path):].rsplit(':', 1)[0]
+        run_command(
+            ['ssh', '-oControlPath={0}'.format(socket_path), '-O', 'exit', target],
+            options
+        )
+    shutil.rmtree(_SSH_CONTROL_DIR, ignore_errors=True)
+
+
 def run_ssh_command(options, remote_command):
     '''
     Run a command using SSH
@@ -1652,17 +1713,21 @@ def download_artifacts_ssh(options):
             get_minion_ip_address(options)
         )
     )
+    sftp_batch = []
     for remote_path, local_path in options.download_artifact:
-        if not os.path.isdir(local_path):
-            os.makedirs(local_path)
-        run_command(
-            'echo "get -r {0} {1}" | {2}'.format(
-                remote_path,
-                local_path,
-                ' '.join(sftp_command)
-            ),
-            options
+        ensure_dir(local_path)
+        sftp_batch.append(
+            pipes.quote('get -r {0} {1}'.format(remote_path, local_path))
         )
+    # Feed all the transfers to a single sftp session so that we only pay
+    # for one SSH connection
+    run_command(
+        'printf \'%s\\n\' {0} | {1}'.format(
+            ' '.join(sftp_batch),
+            ' '.join(sftp_command)
+        ),
+        options
+    )
 
     if using_sudo:
         print_bulleted(options, 'Updating file permissions for the sudo\'ed account')
@@ -1698,8 +1763,7 @@ def download_artifacts_smb(options):
 
         # Create the local directories
         local_path = os.path.abspath(local_path)
-        if not os.path.isdir(local_path):
-            os.makedirs(local_path)
+        ensure_dir(local_path)
 
         # Create the correct path format. ``C:\Path\To\file.txt`` needs to be
         # formatted as ``Path\To\file.txt``. Samba will connect to the ``C$``
@@ -1934,6 +1998,12 @@ def get_args():
         action='store_true',
         help='Try to find the RFC 1918 private address of the minion rather than the external address'
     )
+    ssh_options_group.add_argument(
+        '--ssh-control-master',
+        action='store_true',
+        default=False,
+        help='Re-use a single SSH connection for all SSH related communications'
+    )
 
     # Deployment Selection
     deployment_group = parser.add_argument_group('Deployment Selection')
@@ -2254,6 +2324,9 @@ def main():
                 'You need to specify from which deployment to delete the VM from. --{cloud|lxc|parallels}-deploy'
             )
 
+    if options.ssh_control_master:
+        atexit.register(stop_ssh_control_master, options)
+
     if options.bootstrap_salt_commit is None:
         options.bootstrap_salt_commit = os.environ.get(
             'SALT_MINION_BOOTSTRAP_RELEASE', 'develop'
@@ -2302,7 +2375,6 @@ def main():
         if exitcode != 0:
             print_bulleted(options, 'The execution of the {0!r} SLS failed'.format(sls), 'RED')
             parser.exit(exitcode)
-        time.sleep(1)
 
     if options.test_git_commit is not None:
         check_cloned_reposiory_commit(options)
@@ -2329,7 +2401,6 @@ def main():
             )
             generate_xml_coverage_report(options, exit=False)
             parser.exit(exitcode)
-        time.sleep(1)
 
         generate_xml_coverage_report(options, exit=False)
 
@@ -2339,21 +2410,18 @@ def main():
             run_state_on_vm(options, options.build_packages_sls)
             # Let's download the logs, even if building the packages fails
             logs_dir = os.path.join(options.workspace, 'logs')
-            if not os.path.isdir(logs_dir):
-                os.makedirs(logs_dir)
+            ensure_dir(logs_dir)
             options.download_artifact.append((
                 os.path.join(options.package_artifact_dir, 'salt-buildpackage.log'),
                 logs_dir
             ))
             packages_dir = os.path.join(options.workspace, 'artifacts', 'packages')
-            if not os.path.isdir(packages_dir):
-                os.makedirs(packages_dir)
+            ensure_dir(packages_dir)
             for fglob in ('salt-*.rpm', 'salt-*.deb', 'salt-*.pkg.xz'):
                 options.download_artifact.append((
                     os.path.join(options.package_artifact_dir, fglob),
                     packages_dir
                 ))
-            time.sleep(1)
 
     if options.download_artifact:
         if options.windows:
@@ -12,10 +12,13 @@
 # Import python libs
 from __future__ import absolute_import
 import os
+import re
+import sys
 import copy
 import pprint
 import logging
 import warnings
+import threading
 import subprocess
 
 # Import Salt Testing Libs
@@ -27,6 +30,46 @@ import six
 
 log = logging.getLogger(__name__)
 
+# Maximum number of seconds to wait for ``git describe`` to finish
+GIT_DESCRIBE_TIMEOUT = 10
+
+# Cached path to the git binary. ``False`` means it wasn't searched for yet
+_GIT_BINARY = False
+
+
+def _get_git_binary():
+    '''
+    Return the path to the git binary, searching ``$PATH`` only once per
+    process
+    '''
+    global _GIT_BINARY  # pylint: disable=global-statement
+    if _GIT_BINARY is False:
+        # Late import
+        import salt.utils
+        _GIT_BINARY = salt.utils.which('git')
+    return _GIT_BINARY
+
+
+# Compiled regular expressions used by the salt return assertions
+_REGEX_CACHE = {}
+_REGEX_CACHE_MAX_SIZE = 256
+
+
+def _compile_regex(pattern):
+    '''
+    Return a compiled version of ``pattern``, compiling it only once
+    '''
+    if not isinstance(pattern, six.string_types):
+        # Already compiled
+        return pattern
+    try:
+        return _REGEX_CACHE[pattern]
+    except KeyError:
+        if len(_REGEX_CACHE) >= _REGEX_CACHE_MAX_SIZE:
+            _REGEX_CACHE.clear()
+        compiled = _REGEX_CACHE[pattern] = re.compile(pattern)
+        return compiled
+
 
 class CheckShellBinaryNameAndVersionMixIn(object):
     '''
@@ -34,6 +77,8 @@ class CheckShellBinaryNameAndVersionMixIn(object):
     adds a test case to verify proper version report from Salt's CLI tools.
     '''
 
+    __slots__ = ()
+
     _call_binary_ = None
     _call_binary_expected_version_ = None
 
@@ -68,6 +113,8 @@ class SaltReturnAssertsMixIn(object):
                 self.assertReturnSaltType(ret)
     '''
 
+    __slots__ = ()
+
     def assertReturnSaltType(self, ret):
         try:
             self.assertTrue(isinstance(ret, dict))
@@ -102,39 +149,33 @@ class SaltReturnAssertsMixIn(object):
     def __getWithinSaltReturn(self, ret, keys):
         self.assertReturnNonEmptySaltType(ret)
         keys = self.__return_valid_keys(keys)
-        okeys = keys[:]
-        for part in ret.itervalues():
-            try:
-                ret_item = part[okeys.pop(0)]
-            except (KeyError, TypeError):
-                raise AssertionError(
-                    'Could not get ret{0} from salt\'s return: {1}'.format(
-                        ''.join(['[{0!r}]'.format(k) for k in keys]), part
-                    )
+        # Only the first state return is looked at
+        part = next(six.itervalues(ret))
+        ret_item = part
+        try:
+            for key in keys:
+                ret_item = ret_item[key]
+        except (KeyError, TypeError):
+            raise AssertionError(
+                'Could not get ret{0} from salt\'s return: {1}'.format(
+                    ''.join('[{0!r}]'.format(k) for k in keys), part
                 )
-            while okeys:
-                try:
-                    ret_item = ret_item[okeys.pop(0)]
-                except (KeyError, TypeError):
-                    raise AssertionError(
-                        'Could not get ret{0} from salt\'s return: {1}'.format(
-                            ''.join(['[{0!r}]'.format(k) for k in keys]), part
-                        )
-                    )
-            return ret_item
+            )
+        return ret_item
 
     def assertSaltTrueReturn(self, ret):
         try:
             self.assertTrue(self.__getWithinSaltReturn(ret, 'result'))
         except AssertionError:
-            log.info('Salt Full Return:\n{0}'.format(pprint.pformat(ret)))
+            if log.isEnabledFor(logging.INFO):
+                log.info('Salt Full Return:\n%s', pprint.pformat(ret))
             try:
                 raise AssertionError(
                     '{result} is not True. Salt Comment:\n{comment}'.format(
-                        **(ret.values()[0])
+                        **next(six.itervalues(ret))
                     )
                 )
-            except (AttributeError, IndexError):
+            except (AttributeError, StopIteration):
                 raise AssertionError(
                     'Failed to get result. Salt Returned:\n{0}'.format(
                         pprint.pformat(ret)
@@ -145,14 +186,15 @@ class SaltReturnAssertsMixIn(object):
         try:
             self.assertFalse(self.__getWithinSaltReturn(ret, 'result'))
         except AssertionError:
-            log.info('Salt Full Return:\n{0}'.format(pprint.pformat(ret)))
+            if log.isEnabledFor(logging.INFO):
+                log.info('Salt Full Return:\n%s', pprint.pformat(ret))
             try:
                 raise AssertionError(
                     '{result} is not False. Salt Comment:\n{comment}'.format(
-                        **(ret.values()[0])
+                        **next(six.itervalues(ret))
                     )
                 )
-            except (AttributeError, IndexError):
+            except (AttributeError, StopIteration):
                 raise AssertionError(
                     'Failed to get result. Salt Returned: {0}'.format(ret)
                 )
@@ -161,14 +203,15 @@ class SaltReturnAssertsMixIn(object):
         try:
             self.assertIsNone(self.__getWithinSaltReturn(ret, 'result'))
         except AssertionError:
-            log.info('Salt Full Return:\n{0}'.format(pprint.pformat(ret)))
+            if log.isEnabledFor(logging.INFO):
+                log.info('Salt Full Return:\n%s', pprint.pformat(ret))
             try:
                 raise AssertionError(
                     '{result} is not None. Salt Comment:\n{comment}'.format(
-                        **(ret.values()[0])
+                        **next(six.itervalues(ret))
                     )
                 )
-            except (AttributeError, IndexError):
+            except (AttributeError, StopIteration):
                 raise AssertionError(
                     'Failed to get result. Salt Returned: {0}'.format(ret)
                 )
@@ -208,7 +251,7 @@ class SaltReturnAssertsMixIn(object):
 
     def assertInSaltReturnRegexpMatches(self, ret, pattern, keys=()):
         return self.assertRegexpMatches(
-            self.__getWithinSaltReturn(ret, keys), pattern
+            self.__getWithinSaltReturn(ret, keys), _compile_regex(pattern)
         )
 
     def assertSaltStateChangesEqual(self, ret, comparison, keys=()):
@@ -324,6 +367,9 @@ class SaltClientTestCaseMixIn(AdaptedConfigurationTestCaseMixIn):
                     self.client._check_pub_data({'jid': '0'}),
                     'Passing JID of zero is not handled gracefully')
     '''
+
+    __slots__ = ()
+
     _salt_client_config_file_name_ = 'master'
 
     @property
@@ -337,27 +383,54 @@ class SaltClientTestCaseMixIn(AdaptedConfigurationTestCaseMixIn):
 
 class ShellCaseCommonTestsMixIn(CheckShellBinaryNameAndVersionMixIn):
 
+    __slots__ = ()
+
     def test_salt_with_git_version(self):
         # Late import
         import salt
-        import salt.utils
         import salt.version
 
         if getattr(self, '_call_binary_', None) is None:
             self.skipTest('\'_call_binary_\' not defined.')
-        git = salt.utils.which('git')
+        git = _get_git_binary()
         if not git:
             self.skipTest('The git binary is not available')
 
-        # Let's get the output of git describe
+        # Let's get the output of git describe. Python 3 already closes the
+        # inherited file descriptors cheaply, while Python 2 walks every
+        # possible descriptor number, which is slow on hosts with a high
+        # ``ulimit -n``, so skip it on Linux where nothing sensitive leaks
+        # into ``git describe``.
         process = subprocess.Popen(
             [git, 'describe', '--tags', '--match', 'v[0-9]*'],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            close_fds=True,
+            close_fds=six.PY3 or not sys.platform.startswith('linux'),
             cwd=os.path.dirname(salt.__file__),
         )
-        out, err = process.communicate()
+        # Don't let a stuck git process hang the tests suite
+        timed_out = threading.Event()
+
+        def kill_git():
+            timed_out.set()
+            try:
+                process.kill()
+            except OSError:
+                # git finished in the meantime
+                pass
+
+        killer = threading.Timer(GIT_DESCRIBE_TIMEOUT, kill_git)
+        killer.start()
+        try:
+            out, err = process.communicate()
+        finally:
+            killer.cancel()
+        if timed_out.is_set():
+            self.skipTest(
+                '\'git describe\' did not finish within {0} seconds'.format(
+                    GIT_DESCRIBE_TIMEOUT
+                )
+            )
         if not out:
             self.skipTest(
                 'Failed to get the output of \'git describe\'. '
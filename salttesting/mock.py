@@ -14,22 +14,26 @@ from __future__ import absolute_import
 import sys
 
 try:
-    if sys.version_info >= (3,):
-        # Python 3
+    if sys.version_info >= (3, 3):
+        # Python 3 ships mock as part of the standard library
+        import unittest.mock as __mock_module
         from unittest.mock import (
             Mock,
             MagicMock,
             patch,
             sentinel,
             DEFAULT,
-            # ANY and call will be imported further down
+            call,
+            ANY,
             create_autospec,
             FILTER_DIR,
             NonCallableMock,
             NonCallableMagicMock,
+            mock_open,
             PropertyMock,
-            __version__ as __mock_version
         )
+        # Newer python versions no longer define unittest.mock.__version__
+        __mock_version = getattr(__mock_module, '__version__', '1.0')
     else:
         from mock import (
             Mock,
@@ -64,6 +68,7 @@ except ImportError as exc:
 
     class MagicMock(object):
 
+        __slots__ = ()
         __name__ = '{0}.fakemock'.format(__name__)
 
         def __init__(self, *args, **kwargs):
@@ -78,35 +83,32 @@ except ImportError as exc:
         def __call__(self, *args, **kwargs):
             return self
 
+    # The fake objects hold no state, a single instance can be shared
+    __fake_mock = MagicMock()
+
     Mock = MagicMock
-    patch = MagicMock()
+    patch = __fake_mock
     sentinel = object()
     DEFAULT = object()
-    create_autospec = MagicMock()
+    create_autospec = __fake_mock
     FILTER_DIR = True
-    NonCallableMock = MagicMock()
-    NonCallableMagicMock = MagicMock()
+    NonCallableMock = __fake_mock
+    NonCallableMagicMock = __fake_mock
     mock_open = object()
     PropertyMock = object()
     call = tuple
     ANY = object()
 
 
-if NO_MOCK is False:
+if NO_MOCK is False and sys.version_info < (3, 3):
     try:
-        if sys.version_info >= (3,):
-            # Python 3
-            from unittest.mock import call, ANY
-        else:
-            from mock import call, ANY
+        from mock import call, ANY
     except ImportError:
         NO_MOCK = True
         NO_MOCK_REASON = 'you need to upgrade your mock version to >= 0.8.0'
 
 
-if sys.version_info >= (3,):
-    from mock import mock_open
-else:
+if sys.version_info < (3, 3):
     # backport mock_open from the python 3 unittest.mock library so that we can
     # mock read, readline, readlines, and file iteration properly
 
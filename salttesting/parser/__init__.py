@@ -13,35 +13,100 @@
 from __future__ import absolute_import, print_function
 import os
 import sys
-import time
-import signal
-import shutil
+import errno
 import logging
 import platform
 import optparse
-import tempfile
 import traceback
-import subprocess
 import warnings
-from functools import partial
-from contextlib import closing
 
 import six
-from salttesting import TestLoader, TextTestRunner
-from salttesting import helpers
+from salttesting import TestLoader, TestSuite, TextTestRunner
 from salttesting.version import __version_info__
-from salttesting.xmlunit import HAS_XMLRUNNER, XMLTestRunner
-try:
-    from salttesting.ext import console
-    WIDTH, HEIGHT = console.getTerminalSize()
-    PNUM = WIDTH
-except Exception:
-    PNUM = 70
+
+
+def _get_terminal_size():
+    '''
+    Return the ``(width, height)`` of the terminal, honouring the ``COLUMNS``
+    and ``LINES`` environment variables, each on its own, before asking the
+    terminal itself
+    '''
+    size = []
+    for name in ('COLUMNS', 'LINES'):
+        try:
+            value = int(os.environ[name])
+        except (KeyError, ValueError):
+            value = 0
+        size.append(value if value > 0 else None)
+    columns, lines = size
+    if columns is None or lines is None:
+        probed_columns, probed_lines = _probe_terminal_size()
+        columns = columns or probed_columns
+        lines = lines or probed_lines
+    return columns, lines
+
+
+def _probe_terminal_size():
+    '''
+    Ask the terminal for its ``(width, height)``
+    '''
+    if hasattr(os, 'get_terminal_size'):
+        # Python >= 3.3 knows how to ask the terminal, including on Windows
+        try:
+            columns, lines = os.get_terminal_size()
+            if columns > 0 and lines > 0:
+                return columns, lines
+        except (OSError, ValueError):
+            pass
+    try:
+        from salttesting.ext import console
+        return console.getTerminalSize()
+    except Exception:
+        return 70, 25
+
+
+WIDTH, HEIGHT = _get_terminal_size()
+PNUM = WIDTH
 
 # This is a completely random and meaningful number intended to identify our
 # own signal triggering.
 WEIRD_SIGNAL_NUM = -45654
 
+# Make sure the extra logging levels used by salt are known
+if not hasattr(logging, 'TRACE'):
+    logging.TRACE = 5
+    logging.addLevelName(logging.TRACE, 'TRACE')
+if not hasattr(logging, 'GARBAGE'):
+    logging.GARBAGE = 1
+    logging.addLevelName(logging.GARBAGE, 'GARBAGE')
+
+# Tests suite logging format
+LOGGING_FORMAT = (
+    '%(asctime)s,%(msecs)03d [%(name)-5s:%(lineno)-4d]'
+    '[%(levelname)-8s] %(message)s'
+)
+LOGGING_DATEFMT = '%H:%M:%S'
+
+# Console logging level for each verbosity count. Console logging is only
+# setup starting at -v(verbosity=2)
+CONSOLE_LOGGING_LEVELS = (
+    None,               # Not used
+    None,               # Default verbosity, no console logging
+    logging.ERROR,      # -v
+    logging.INFO,       # -vv
+    logging.DEBUG,      # -vvv
+    logging.TRACE,      # -vvvv
+    logging.GARBAGE,    # -vvvvv
+)
+
+# runtests.py options which are named differently in salt-runtests
+SALT_RUNTESTS_OPTIONS = {
+    '--coverage-xml': '--coverage-xml-output',
+    '--coverage-html': '--coverage-html-output',
+    '--xml': '--xml-out-path',
+    '--xml-out': '--xml-out-path',
+}
+
 
 # Let's setup a global exception hook handler which will log all exceptions
 # Store a reference to the original handler
@@ -71,30 +136,113 @@ def __global_logging_exception_handler(exc_type, exc_value, exc_traceback):
 sys.excepthook = __global_logging_exception_handler
 
 
+# print_header() format strings, keyed by ``(inline, centered)``
+_HEADER_FORMATS = {
+    (False, False): u'{0}',
+    (False, True): u'{0:^{width}}',
+    (True, False): u'{0:{sep}<{width}}',
+    (True, True): u'{0:{sep}^{width}}',
+}
+
+# print_header() rulers, keyed by ``(sep, width)``
+_HEADER_RULERS = {}
+
+
+def _get_ruler(sep, width):
+    '''
+    Return a ``width`` long ruler made of ``sep``
+    '''
+    try:
+        return _HEADER_RULERS[(sep, width)]
+    except KeyError:
+        ruler = _HEADER_RULERS[(sep, width)] = sep * width
+        return ruler
+
+
+def _to_unicode(text):
+    '''
+    Return ``text`` as unicode. On Python 2, test results might hold byte
+    strings with non ASCII characters, for example, from assertion messages
+    '''
+    if isinstance(text, six.binary_type):
+        return text.decode('utf-8', 'replace')
+    return text
+
+
+def format_header(header, sep='~', top=True, bottom=True, inline=False,
+                  centered=False, width=PNUM):
+    '''
+    Return the list of lines which :func:`print_header` would print
+    '''
+    lines = []
+    if top and not inline:
+        lines.append(_get_ruler(sep, width))
+
+    fmt = _HEADER_FORMATS[(bool(inline), bool(centered))]
+    lines.append(fmt.format(header, sep=sep, width=width))
+
+    if bottom and not inline:
+        lines.append(_get_ruler(sep, width))
+    return lines
+
+
 def print_header(header, sep='~', top=True, bottom=True, inline=False,
                  centered=False, width=PNUM):
     '''
     Allows some pretty printing of headers on the console, either with a
     "ruler" on bottom and/or top, inline, centered, etc.
     '''
-    if top and not inline:
-        print(sep * width)
-
-    if centered and not inline:
-        fmt = u'{0:^{width}}'
-    elif inline and not centered:
-        fmt = u'{0:{sep}<{width}}'
-    elif inline and centered:
-        fmt = u'{0:{sep}^{width}}'
-    else:
-        fmt = u'{0}'
-    print(fmt.format(header, sep=sep, width=width))
+    print(u'\n'.join(
+        format_header(header, sep=sep, top=top, bottom=bottom, inline=inline,
+                      centered=centered, width=width)
+    ))
 
-    if bottom and not inline:
-        print(sep * width)
+
+def _build_docked_flag_args(option, value, flag_value):
+    if value != flag_value:
+        # This flag doesn't set the value we have. For example, '--clean'
+        # when the value came from '--no-clean'
+        return []
+    return [option.get_opt_string()]
+
+
+def _build_docked_store_args(option, value):
+    return [option.get_opt_string(), str(value)]
+
+
+def _build_docked_append_args(option, value):
+    args = []
+    opt_string = option.get_opt_string()
+    for val in value:
+        args.extend([opt_string, str(val)])
+    return args
+
+
+def _build_docked_count_args(option, value):
+    return [option.get_opt_string()] * value
+
+
+# Functions which build the command line arguments to pass to the tests suite
+# running under docker, keyed by the option action
+_DOCKED_ARGS_BUILDERS = {
+    'store': _build_docked_store_args,
+    'store_const': lambda option, value: _build_docked_flag_args(
+        option, value, option.const
+    ),
+    'store_true': lambda option, value: _build_docked_flag_args(
+        option, value, True
+    ),
+    'store_false': lambda option, value: _build_docked_flag_args(
+        option, value, False
+    ),
+    'append': _build_docked_append_args,
+    'count': _build_docked_count_args,
+}
 
 
 class SaltTestingParser(optparse.OptionParser):
+    support_tests_selection = True
+    support_xml_output = True
     support_docker_execution = False
     support_destructive_tests_selection = False
     support_expensive_tests_selection = False
@@ -138,10 +286,13 @@ class SaltTestingParser(optparse.OptionParser):
             'XML_TESTS_OUTPUT_DIR'
         )
         xml_output_dir = kwargs.pop('xml_output_dir', None)
-
-        if xml_output_dir_env_var in os.environ:
-            xml_output_dir = os.environ.get(xml_output_dir_env_var)
+        # The environment variable, when set, takes precedence. Only fall back
+        # to the system's temporary directory if neither was provided.
+        xml_output_dir = os.environ.get(xml_output_dir_env_var) or \
+            xml_output_dir
         if not xml_output_dir:
+            # Late import
+            import tempfile
             xml_output_dir = os.path.join(
                 tempfile.gettempdir() if platform.system() != 'Darwin' else '/tmp',
                 'xml-tests-output'
@@ -154,6 +305,7 @@ class SaltTestingParser(optparse.OptionParser):
         optparse.OptionParser.__init__(self, *args, **kwargs)
         self.testsuite_directory = testsuite_directory
         self.testsuite_results = []
+        self._loader = None
 
         self.test_selection_group = optparse.OptionGroup(
             self,
@@ -195,7 +347,8 @@ class SaltTestingParser(optparse.OptionParser):
             help=('The location of a newline delimited file of test names to '
                   'run')
         )
-        self.add_option_group(self.test_selection_group)
+        if self.support_tests_selection is True:
+            self.add_option_group(self.test_selection_group)
 
         if self.support_docker_execution is True:
             self.docked_selection_group = optparse.OptionGroup(
@@ -260,7 +413,8 @@ class SaltTestingParser(optparse.OptionParser):
             default=self.tests_logfile,
             help='The path to the tests suite logging logfile'
         )
-        if self.xml_output_dir is not None:
+        if self.xml_output_dir is not None and \
+                self.support_xml_output is True:
             self.output_options_group.add_option(
                 '-x',
                 '--xml',
@@ -271,6 +425,8 @@ class SaltTestingParser(optparse.OptionParser):
                     self.xml_output_dir
                 )
             )
+        else:
+            self.set_default('xml_out', False)
         self.output_options_group.add_option(
             '--no-report',
             default=False,
@@ -322,14 +478,17 @@ class SaltTestingParser(optparse.OptionParser):
                 salt_runtests.print_bulleted(
                     'Please use the salt-runtests script directly', 'YELLOW'
                 )
-                for idx, arg in enumerate(sys.argv[:]):
-                    if '--coverage-xml' in arg:
-                        sys.argv[idx] = arg.replace('--coverage-xml', '--coverage-xml-output')
-                    if '--coverage-html' in arg:
-                        sys.argv[idx] = arg.replace('--coverage-html', '--coverage-html-output')
-                    if '--xml' in arg:
-                        sys.argv[idx] = arg.replace('--xml', '--xml-out-path')
-                        sys.argv.append('--xml-out')
+                xml_out = False
+                for idx, arg in enumerate(sys.argv):
+                    opt, sep, value = arg.partition('=')
+                    if opt not in SALT_RUNTESTS_OPTIONS:
+                        continue
+                    opt = SALT_RUNTESTS_OPTIONS[opt]
+                    sys.argv[idx] = opt + sep + value
+                    if opt == '--xml-out-path':
+                        xml_out = True
+                if xml_out:
+                    sys.argv.append('--xml-out')
 
                 sys.argv[0] = 'salt-runtests'
                 sys.exit(salt_runtests.parse_args())
@@ -347,6 +506,12 @@ class SaltTestingParser(optparse.OptionParser):
             else:
                 self.options.name = lines
 
+        if self.options.xml_out:
+            # Override any environment setting with the passed value. Do it
+            # before cleaning up so that the directory actually written to
+            # is the one removed
+            self.xml_output_dir = self.options.xml_out
+
         print_header(u'', inline=True, width=self.options.output_columns)
         self.pre_execution_cleanup()
 
@@ -375,8 +540,12 @@ class SaltTestingParser(optparse.OptionParser):
         # tests suite under a docker container
         self._validate_options()
 
-        print(' * Current Directory: {0}'.format(os.getcwd()))
-        print(' * Test suite is running under PID {0}'.format(os.getpid()))
+        sys.stdout.write(
+            ' * Current Directory: {0}\n'
+            ' * Test suite is running under PID {1}\n'.format(
+                os.getcwd(), os.getpid()
+            )
+        )
 
         self._setup_logging()
         try:
@@ -384,6 +553,19 @@ class SaltTestingParser(optparse.OptionParser):
         finally:
             print_header(u'', inline=True, width=self.options.output_columns)
 
+    @property
+    def loader(self):
+        '''
+        The :class:`TestLoader<salttesting.unit.TestLoader>` instance shared
+        by the ``run_testcase()`` calls of this parser.
+
+        Not used for discovery, ``TestLoader.discover()`` remembers the
+        top level directory of the previous call.
+        '''
+        if self._loader is None:
+            self._loader = TestLoader()
+        return self._loader
+
     def setup_additional_options(self):
         '''
         Subclasses should add additional options in this overridden method
@@ -393,20 +575,21 @@ class SaltTestingParser(optparse.OptionParser):
         '''
         Validate the default available options
         '''
-        if self.xml_output_dir is not None and self.options.xml_out and \
-                HAS_XMLRUNNER is False:
-            self.error(
-                '\'--xml\' is not available. The xmlrunner library is not '
-                'installed.'
-            )
-
-        if self.options.xml_out:
-            # Override any environment setting with the passed value
-            self.xml_output_dir = self.options.xml_out
+        if self.xml_output_dir is not None and self.options.xml_out:
+            # Late import, the xmlrunner library is only needed for XML output
+            from salttesting.xmlunit import HAS_XMLRUNNER
+            if HAS_XMLRUNNER is False:
+                self.error(
+                    '\'--xml\' is not available. The xmlrunner library is not '
+                    'installed.'
+                )
 
         if self.xml_output_dir is not None and self.options.xml_out:
-            if not os.path.isdir(self.xml_output_dir):
+            try:
                 os.makedirs(self.xml_output_dir)
+            except OSError as exc:
+                if exc.errno != errno.EEXIST:
+                    raise
             print(
                 ' * Generated unit test XML reports will be stored '
                 'at {0!r}'.format(self.xml_output_dir)
@@ -434,22 +617,17 @@ class SaltTestingParser(optparse.OptionParser):
         '''
         Setup python's logging system to work with/for the tests suite
         '''
-        # Setup tests logging
-        formatter = logging.Formatter(
-            '%(asctime)s,%(msecs)03.0f [%(name)-5s:%(lineno)-4d]'
-            '[%(levelname)-8s] %(message)s',
-            datefmt='%H:%M:%S'
-        )
-        if not hasattr(logging, 'TRACE'):
-            logging.TRACE = 5
-            logging.addLevelName(logging.TRACE, 'TRACE')
-        if not hasattr(logging, 'GARBAGE'):
-            logging.GARBAGE = 1
-            logging.addLevelName(logging.GARBAGE, 'GARBAGE')
-
         # Default logging level: ERROR
         logging.root.setLevel(logging.NOTSET)
 
+        log_to_console = self.options.verbosity >= 2
+        if not self.options.tests_logfile and not log_to_console:
+            # No logging handlers to setup
+            return
+
+        # Setup tests logging
+        formatter = logging.Formatter(LOGGING_FORMAT, datefmt=LOGGING_DATEFMT)
+
         if self.options.tests_logfile:
             filehandler = logging.FileHandler(
                 mode='w',           # Not preserved between re-runs
@@ -463,25 +641,26 @@ class SaltTestingParser(optparse.OptionParser):
             print(' * Logging tests on {0}'.format(self.options.tests_logfile))
 
         # With greater verbosity we can also log to the console
-        if self.options.verbosity >= 2:
+        if log_to_console:
             consolehandler = logging.StreamHandler(sys.stderr)
             consolehandler.setFormatter(formatter)
-            if self.options.verbosity >= 6:     # -vvvvv
-                logging_level = logging.GARBAGE
-            elif self.options.verbosity == 5:   # -vvvv
-                logging_level = logging.TRACE
-            elif self.options.verbosity == 4:   # -vvv
-                logging_level = logging.DEBUG
-                print('DEBUG')
-            elif self.options.verbosity == 3:   # -vv
-                print('INFO')
-                logging_level = logging.INFO
-            else:
-                logging_level = logging.ERROR
-            consolehandler.setLevel(logging_level)
+            consolehandler.setLevel(
+                CONSOLE_LOGGING_LEVELS[min(self.options.verbosity, 6)]
+            )
             logging.root.addHandler(consolehandler)
             logging.getLogger(__name__).info('Runtests logging has been setup')
 
+    def _output_paths(self):
+        '''
+        Yield the output directories which will be written to by this run.
+
+        ``--xml`` overrides ``xml_output_dir`` as soon as the options are
+        parsed, so the XML reports directory yielded is always the one the
+        XML test runner writes to.
+        '''
+        if self.xml_output_dir is not None and self.options.xml_out:
+            yield self.xml_output_dir
+
     def pre_execution_cleanup(self):
         '''
         Run any initial clean up operations. If sub-classed, don't forget to
@@ -489,11 +668,14 @@ class SaltTestingParser(optparse.OptionParser):
         method.
         '''
         if self.options.clean is True:
-            for path in (self.xml_output_dir,):
-                if path is None:
-                    continue
-                if os.path.isdir(path):
+            # Late import
+            import shutil
+            for path in self._output_paths():
+                try:
                     shutil.rmtree(path)
+                except OSError as exc:
+                    if exc.errno != errno.ENOENT:
+                        raise
 
     def run_suite(self, path, display_name, suffix='[!_]*.py',
                   load_from_name=False, additional_test_dirs=None):
@@ -501,6 +683,7 @@ class SaltTestingParser(optparse.OptionParser):
         Execute a unit test suite
         '''
         loaded_custom = False
+        # A fresh loader for each discovery, see the loader property
         loader = TestLoader()
         try:
             if load_from_name:
@@ -525,6 +708,8 @@ class SaltTestingParser(optparse.OptionParser):
                      width=self.options.output_columns)
 
         if self.options.xml_out:
+            # Late import
+            from salttesting.xmlunit import XMLTestRunner
             runner = XMLTestRunner(
                 stream=sys.stdout,
                 output=self.xml_output_dir,
@@ -542,21 +727,34 @@ class SaltTestingParser(optparse.OptionParser):
         '''
         Print a nicely formatted report about the test suite results
         '''
-        print()
-        print_header(
+        # Collect the whole report and write it out at once
+        lines = [u'']
+        width = self.options.output_columns
+
+        def header(*args, **kwargs):
+            lines.extend(format_header(*args, width=width, **kwargs))
+
+        # These lines don't change during the report, format them only once
+        report_banner = format_header(
             u'  Overall Tests Report  ', sep=u'=', centered=True, inline=True,
-            width=self.options.output_columns
+            width=width
         )
+        section_footer = format_header(u' ', sep='-', inline=True, width=width)
+        test_footer = format_header(u'   ', sep=u'.', inline=True, width=width)
+
+        lines.extend(report_banner)
 
         failures = errors = skipped = passed = 0
         no_problems_found = True
         for (name, results) in self.testsuite_results:
-            failures += len(results.failures)
-            errors += len(results.errors)
-            skipped += len(results.skipped)
-            passed += results.testsRun - len(
-                results.failures + results.errors + results.skipped
-            )
+            suite_failures = len(results.failures)
+            suite_errors = len(results.errors)
+            suite_skipped = len(results.skipped)
+            failures += suite_failures
+            errors += suite_errors
+            skipped += suite_skipped
+            passed += (results.testsRun - suite_failures - suite_errors -
+                       suite_skipped)
 
             if not results.failures and not results.errors and \
                     not results.skipped:
@@ -564,81 +762,58 @@ class SaltTestingParser(optparse.OptionParser):
 
             no_problems_found = False
 
-            print_header(
-                u'*** {0}  '.format(name), sep=u'*', inline=True,
-                width=self.options.output_columns
-            )
+            header(u'*** {0}  '.format(name), sep=u'*', inline=True)
             if results.skipped:
-                print_header(
-                    u' --------  Skipped Tests  ', sep='-', inline=True,
-                    width=self.options.output_columns
-                )
-                maxlen = len(
-                    max([testcase.id() for (testcase, reason) in
-                         results.skipped], key=len)
-                )
+                header(u' --------  Skipped Tests  ', sep='-', inline=True)
+                skipped_tests = [
+                    (testcase.id(), reason) for (testcase, reason) in
+                    results.skipped
+                ]
+                maxlen = max(len(test_id) for (test_id, _) in skipped_tests)
                 fmt = u'   -> {0: <{maxlen}}  ->  {1}'
-                for testcase, reason in results.skipped:
-                    print(fmt.format(testcase.id(), reason, maxlen=maxlen))
-                print_header(u' ', sep='-', inline=True,
-                             width=self.options.output_columns)
-
-            if results.errors:
-                print_header(
-                    u' --------  Tests with Errors  ', sep='-', inline=True,
-                    width=self.options.output_columns
-                )
-                for testcase, reason in results.errors:
-                    print_header(
-                        u'   -> {0}  '.format(testcase.id()),
-                        sep=u'.', inline=True,
-                        width=self.options.output_columns
-                    )
-                    for line in reason.rstrip().splitlines():
-                        print('       {0}'.format(line.rstrip()))
-                    print_header(u'   ', sep=u'.', inline=True,
-                                 width=self.options.output_columns)
-                print_header(u' ', sep='-', inline=True,
-                             width=self.options.output_columns)
-
-            if results.failures:
-                print_header(
-                    u' --------  Failed Tests  ', sep='-', inline=True,
-                    width=self.options.output_columns
-                )
-                for testcase, reason in results.failures:
-                    print_header(
-                        u'   -> {0}  '.format(testcase.id()),
-                        sep=u'.', inline=True,
-                        width=self.options.output_columns
+                for test_id, reason in skipped_tests:
+                    lines.append(
+                        fmt.format(test_id, _to_unicode(reason), maxlen=maxlen)
                     )
-                    for line in reason.rstrip().splitlines():
-                        print('       {0}'.format(line.rstrip()))
-                    print_header(u'   ', sep=u'.', inline=True,
-                                 width=self.options.output_columns)
-                print_header(u' ', sep='-', inline=True,
-                             width=self.options.output_columns)
+                lines.extend(section_footer)
+
+            for title, tests in ((u'Tests with Errors', results.errors),
+                                 (u'Failed Tests', results.failures)):
+                if not tests:
+                    continue
+                header(u' --------  {0}  '.format(title), sep='-', inline=True)
+                for testcase, reason in tests:
+                    header(u'   -> {0}  '.format(testcase.id()),
+                           sep=u'.', inline=True)
+                    for line in _to_unicode(reason).rstrip().splitlines():
+                        lines.append(u'       {0}'.format(line.rstrip()))
+                    lines.extend(test_footer)
+                lines.extend(section_footer)
 
         if no_problems_found:
-            print_header(
-                u'***  No Problems Found While Running Tests  ',
-                sep=u'*', inline=True, width=self.options.output_columns
-            )
+            header(u'***  No Problems Found While Running Tests  ',
+                   sep=u'*', inline=True)
 
-        print_header(u'', sep=u'=', inline=True,
-                     width=self.options.output_columns)
+        header(u'', sep=u'=', inline=True)
         total = sum([passed, skipped, errors, failures])
-        print(
+        lines.append(
             '{0} (total={1}, skipped={2}, passed={3}, failures={4}, '
             'errors={5}) '.format(
                 (errors or failures) and 'FAILED' or 'OK',
                 total, skipped, passed, failures, errors
             )
         )
-        print_header(
-            '  Overall Tests Report  ', sep='=', centered=True, inline=True,
-            width=self.options.output_columns
-        )
+        lines.extend(report_banner)
+        lines.append(u'')
+
+        output = u'\n'.join(lines)
+        if six.PY2:
+            # Python 2 file objects would encode unicode as ASCII
+            output = output.encode(
+                getattr(sys.stdout, 'encoding', None) or 'utf-8', 'replace'
+            )
+        sys.stdout.write(output)
+        sys.stdout.flush()
 
     def post_execution_cleanup(self):
         '''
@@ -654,15 +829,15 @@ class SaltTestingParser(optparse.OptionParser):
         if self.options.no_report is False:
             self.print_overall_testsuite_report()
         self.post_execution_cleanup()
+        # Late import
+        from salttesting import helpers
         # Brute force approach to terminate this process and it's children
         logging.getLogger(__name__).info('Terminating test suite child processes.')
         helpers.terminate_process_pid(os.getpid(), only_children=True)
         logging.getLogger(__name__).info('Terminating test suite child processes if any are still found running.')
         helpers.terminate_process_pid(os.getpid(), only_children=True)
         logging.getLogger(__name__).info(
-            'Test suite execution finalized with exit code: {0}'.format(
-                exit_code
-            )
+            'Test suite execution finalized with exit code: %s', exit_code
         )
         self.exit(exit_code)
 
@@ -670,6 +845,25 @@ class SaltTestingParser(optparse.OptionParser):
         '''
         Run the tests suite in a Docker container
         '''
+        # Late import, only needed when running the tests suite in Docker
+        import time
+        import signal
+        import tempfile
+        import subprocess
+        from functools import partial
+
+        def run_docker_command(*args):
+            # Run a docker command and return its stripped output
+            proc = subprocess.Popen(
+                [self.options.docker_binary] + list(args),
+                close_fds=True,
+                stdout=subprocess.PIPE
+            )
+            output = proc.communicate()[0].strip()
+            if six.PY3:
+                output = output.decode(__salt_system_encoding__)
+            return output
+
         def stop_running_docked_container(cid, signum=None, frame=None):
             # Allow some time for the container to stop if it's going to be
             # stopped by docker or any signals docker might have received
@@ -677,52 +871,27 @@ class SaltTestingParser(optparse.OptionParser):
 
             print_header('', inline=True, width=self.options.output_columns)
 
-            # Let's check if, in fact, the container is stopped
-            scode_call = subprocess.Popen(
-                [self.options.docker_binary, 'inspect', '--format={{.State.Running}}', cid],
-                env=os.environ.copy(),
-                close_fds=True,
-                stdout=subprocess.PIPE
-            )
-            scode_call.wait()
-            parsed_scode = scode_call.stdout.read().strip()
-            if six.PY3:
-                parsed_scode = parsed_scode.decode(__salt_system_encoding__)
-            if parsed_scode != 'false':
+            # Let's check if, in fact, the container is stopped, and grab its
+            # exit code while at it. We can't trust on Popen's returncode
+            # because it's not reporting the proper one? Still haven't
+            # narrowed it down why.
+            running, _, parsed_rcode = run_docker_command(
+                'inspect', '--format={{.State.Running}}|{{.State.ExitCode}}', cid
+            ).partition('|')
+            if running != 'false':
                 # If the container is still running, let's make sure it
                 # properly stops
                 sys.stdout.write(' * Making sure the container is stopped. CID: ')
                 sys.stdout.flush()
-
-                stop_call = subprocess.Popen(
-                    [self.options.docker_binary, 'stop', '--time=15', cid],
-                    env=os.environ.copy(),
-                    close_fds=True,
-                    stdout=subprocess.PIPE
-                )
-                stop_call.wait()
-                output = stop_call.stdout.read().strip()
-                if six.PY3:
-                    output = output.decode(__salt_system_encoding__)
-                print(output)
+                print(run_docker_command('stop', '--time=15', cid))
                 sys.stdout.flush()
                 time.sleep(0.5)
+                # The exit code is only final once the container stopped
+                parsed_rcode = run_docker_command(
+                    'inspect', '--format={{.State.ExitCode}}', cid
+                )
 
-            # Let's get the container's exit code. We can't trust on Popen's
-            # returncode because it's not reporting the proper one? Still
-            # haven't narrowed it down why.
             sys.stdout.write(' * Container exit code: ')
-            sys.stdout.flush()
-            rcode_call = subprocess.Popen(
-                [self.options.docker_binary, 'inspect', '--format={{.State.ExitCode}}', cid],
-                env=os.environ.copy(),
-                close_fds=True,
-                stdout=subprocess.PIPE
-            )
-            rcode_call.wait()
-            parsed_rcode = rcode_call.stdout.read().strip()
-            if six.PY3:
-                parsed_rcode = parsed_rcode.decode(__salt_system_encoding__)
             try:
                 returncode = int(parsed_rcode)
             except ValueError:
@@ -736,17 +905,7 @@ class SaltTestingParser(optparse.OptionParser):
                                 returncode == 0)):
                 sys.stdout.write(' * Cleaning Up Temporary Docker Container. CID: ')
                 sys.stdout.flush()
-                cleanup_call = subprocess.Popen(
-                    [self.options.docker_binary, 'rm', cid],
-                    env=os.environ.copy(),
-                    close_fds=True,
-                    stdout=subprocess.PIPE
-                )
-                cleanup_call.wait()
-                output = cleanup_call.stdout.read().strip()
-                if six.PY3:
-                    output = output.decode(__salt_system_encoding__)
-                print(output)
+                print(run_docker_command('rm', cid))
 
             if 'DOCKER_CIDFILE' not in os.environ:
                 # The CID file was not created "from the outside", so delete it
@@ -762,40 +921,35 @@ class SaltTestingParser(optparse.OptionParser):
         else:
             container = self.options.docked
 
-        calling_args = [self.options.docked_interpreter,
+        defaults = self.defaults
+        options = self.options
+        calling_args = [options.docked_interpreter,
                         '/salt-source/tests/runtests.py']
         for option in self._get_all_options():
-            if option.dest is None:
+            dest = option.dest
+            if dest is None:
                 # For example --version
                 continue
 
-            if option.dest and (option.dest in ('verbosity',) or
-                                option.dest.startswith('docked')):
+            if dest in ('verbosity',) or dest.startswith('docked'):
                 # We don't need to pass any docker related arguments inside the
                 # container, and verbose will be handled bellow
                 continue
 
-            default = self.defaults.get(option.dest)
-            value = getattr(self.options, option.dest, default)
+            default = defaults.get(dest)
+            value = getattr(options, dest, default)
 
             if default == value:
                 # This is the default value, no need to pass the option to the
                 # parser
                 continue
 
-            if option.action.startswith('store_'):
-                calling_args.append(option.get_opt_string())
-
-            elif option.action == 'append':
-                for val in (value is not None and value or default):
-                    calling_args.extend([option.get_opt_string(), str(val)])
-            elif option.action == 'count':
-                calling_args.extend([option.get_opt_string()] * value)
-            else:
-                calling_args.extend(
-                    [option.get_opt_string(),
-                    str(value is not None and value or default)]
-                )
+            if value is None:
+                value = default
+            build_args = _DOCKED_ARGS_BUILDERS.get(
+                option.action, _build_docked_store_args
+            )
+            calling_args.extend(build_args(option, value))
 
         if not self.options.run_destructive:
             calling_args.append('--run-destructive')
@@ -837,65 +991,90 @@ class SaltTestingParser(optparse.OptionParser):
              # that the start-me-up.sh script can handle them properly
              ' '.join(calling_args),
              ],
-            env=os.environ.copy(),
             close_fds=True,
         )
 
+        def read_cid():
+            try:
+                with open(cidfile) as cidfile_fd:
+                    return cidfile_fd.read()
+            except IOError as exc:
+                # Docker only writes the file once the container is created,
+                # which might take a while, for example, when the image still
+                # needs to be pulled
+                if exc.errno != errno.ENOENT:
+                    raise
+
         cid = None
-        cid_printed = terminating = exiting = False
         signal_handler_installed = signalled = False
 
-        time.sleep(0.25)
+        try:
+            # Wait for docker to write the container ID
+            while not cid and call.poll() is None:
+                time.sleep(0.15)
+                cid = read_cid()
+
+            if cid:
+                print(cid)
+                sys.stdout.flush()
+                # Install our signal handler to properly shutdown the docker
+                # container
+                signal_handler = partial(stop_running_docked_container, cid)
+                for sig in (signal.SIGTERM, signal.SIGINT,
+                            signal.SIGHUP, signal.SIGQUIT):
+                    signal.signal(sig, signal_handler)
+                signal_handler_installed = True
+
+            # Block until the tests suite execution finishes. Any signal we
+            # receive from now on is handled by stop_running_docked_container
+            call.wait()
+        except KeyboardInterrupt:
+            print('Caught CTRL-C, exiting...')
+            signalled = True
+            call.send_signal(signal.SIGINT)
+
+        if signalled:
+            # Escalate if docker doesn't stop on its own. Any further CTRL-C
+            # moves on to the next step right away
+            for stop in (call.terminate, call.kill):
+                try:
+                    time.sleep(0.15)
+                except KeyboardInterrupt:
+                    pass
+                if call.poll() is not None:
+                    break
+                stop()
 
         while True:
             try:
-                time.sleep(0.15)
-                if cid_printed is False:
-                    with closing(open(cidfile)) as cidfile_fd:
-                        cid = cidfile_fd.read()
-                        if cid:
-                            print(cid)
-                            sys.stdout.flush()
-                            cid_printed = True
-                            # Install our signal handler to properly shutdown
-                            # the docker container
-                            for sig in (signal.SIGTERM, signal.SIGINT,
-                                        signal.SIGHUP, signal.SIGQUIT):
-                                signal.signal(
-                                    sig,
-                                    partial(stop_running_docked_container, cid)
-                                )
-                            signal_handler_installed = True
-
-                if exiting:
-                    break
-                elif terminating and not exiting:
-                    exiting = True
-                    call.kill()
-                    break
-                elif signalled and not terminating:
-                    terminating = True
-                    call.terminate()
-                else:
-                    call.poll()
-                    if call.returncode is not None:
-                        # Finished
-                        break
+                call.wait()
+                break
             except KeyboardInterrupt:
-                print('Caught CTRL-C, exiting...')
+                # Don't skip the clean up below, just make sure docker dies
                 signalled = True
-                call.send_signal(signal.SIGINT)
+                call.kill()
 
-        call.wait()
-        time.sleep(0.25)
+        if not cid:
+            # The container might have been created while we were
+            # interrupted, or docker exited before we got to read its ID.
+            # Either way, it still needs to be stopped and removed.
+            cid = read_cid()
 
         # Finish up
-        if signal_handler_installed:
+        if signal_handler_installed or cid:
             stop_running_docked_container(
                 cid,
                 signum=(signal.SIGINT if signalled else WEIRD_SIGNAL_NUM)
             )
         else:
+            if 'DOCKER_CIDFILE' not in os.environ:
+                # The CID file was not created "from the outside", so delete
+                # it, if docker got to create it
+                try:
+                    os.unlink(cidfile)
+                except OSError as exc:
+                    if exc.errno != errno.ENOENT:
+                        raise
             sys.exit(call.returncode)
 
 
@@ -904,32 +1083,35 @@ class SaltTestcaseParser(SaltTestingParser):
     Option parser to run one or more ``unittest.case.TestCase``, ie, no
     discovery involved.
     '''
+    support_tests_selection = False
+    support_xml_output = False
+
     def __init__(self, *args, **kwargs):
         SaltTestingParser.__init__(self, None, *args, **kwargs)
         self.usage = '%prog [options]'
-        self.option_groups.remove(self.test_selection_group)
-        if self.has_option('--xml-out'):
-            self.remove_option('--xml-out')
 
     def get_prog_name(self):
-        return '{0} {1}'.format(sys.executable.split(os.sep)[-1], sys.argv[0])
+        return '{0} {1}'.format(os.path.basename(sys.executable), sys.argv[0])
 
     def run_testcase(self, testcase):
         '''
         Run one or more ``unittest.case.TestCase``
         '''
-        header = ''
-        loader = TestLoader()
         if isinstance(testcase, list):
-            for case in testcase:
-                tests = loader.loadTestsFromTestCase(case)
+            testcases = testcase
         else:
-            tests = loader.loadTestsFromTestCase(testcase)
+            testcases = [testcase]
+
+        loader = self.loader
+        tests = TestSuite(
+            [loader.loadTestsFromTestCase(case) for case in testcases]
+        )
 
-        if not isinstance(testcase, list):
-            header = '{0} Tests'.format(testcase.__name__)
-            print_header('Starting {0}'.format(header),
-                         width=self.options.output_columns)
+        header = '{0} Tests'.format(
+            ', '.join([case.__name__ for case in testcases])
+        )
+        print_header('Starting {0}'.format(header),
+                     width=self.options.output_columns)
 
         runner = TextTestRunner(
             verbosity=self.options.verbosity).run(tests)
@@ -945,10 +1127,10 @@ def run_testcase(testcase):
     if __version_info__ >= (2014, 4, 24):
         sys.stderr.write(
             'Please use the \'salt-runtests\' binary to run the tests '
-            'from {0[0]}'.format(sys.argv)
+            'from {0[0]}\n'.format(sys.argv)
         )
         sys.stderr.flush()
-        exit(1)
+        sys.exit(1)
 
 
 def run_tests(*test_cases, **kwargs):